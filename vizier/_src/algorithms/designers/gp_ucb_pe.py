@@ -161,6 +161,30 @@ def _compute_ucb_threshold(
   return pred_mean[jnp.argmax(ucb_values)]
 
 
+def _compute_pe_threshold(
+    predictive: sp.UniformEnsemblePredictive,
+    predictive_all_features: sp.UniformEnsemblePredictive,
+    ucb_coefficient: jt.Float[jt.Array, ''],
+) -> jax.Array:
+  """Computes the UCB threshold over the completed and pending features.
+
+  Args:
+    predictive: Predictive model conditioned on completed trials.
+    predictive_all_features: Predictive model conditioned on completed and
+      pending trials.
+    ucb_coefficient: The UCB coefficient.
+
+  Returns:
+    The threshold used by the PE constraint `UCB(xs) >= threshold`.
+  """
+  features = predictive_all_features.predictives.observed_data.features
+  is_missing = (
+      features.continuous.is_missing[0] | features.categorical.is_missing[0]
+  )
+  gprm_threshold = predictive.predict(features)
+  return _compute_ucb_threshold(gprm_threshold, is_missing, ucb_coefficient)
+
+
 # TODO: Use acquisitions.TrustRegion instead.
 def _apply_trust_region(
     tr: acquisitions.TrustRegion, xs: types.ModelInput, acq_values: jax.Array
@@ -292,6 +316,9 @@ class PEScoreFunction(eqx.Module):
       values on `xs`.
     penalty_coefficient: Multiplier on the constraint violation penalty.
     trust_region:
+    threshold: The UCB threshold of the constraint. It is derived in
+      `__post_init__` from the predictive models and `ucb_coefficient`, and is
+      not a constructor argument.
 
   Returns:
     The Pure-Exploration acquisition value.
@@ -303,6 +330,14 @@ class PEScoreFunction(eqx.Module):
   explore_ucb_coefficient: jt.Float[jt.Array, '']
   penalty_coefficient: jt.Float[jt.Array, '']
   trust_region: Optional[acquisitions.TrustRegion]
+  threshold: jt.Float[jt.Array, ''] = eqx.field(init=False)
+
+  def __post_init__(self):
+    # The threshold does not depend on the evaluated points, so it is computed
+    # once here instead of in every call of `score_with_aux`.
+    self.threshold = eqx.filter_jit(_compute_pe_threshold)(
+        self.predictive, self.predictive_all_features, self.ucb_coefficient
+    )
 
   def score(
       self, xs: types.ModelInput, seed: Optional[jax.Array] = None
@@ -318,14 +353,6 @@ class PEScoreFunction(eqx.Module):
       self, xs: types.ModelInput, seed: Optional[jax.Array] = None
   ) -> tuple[jax.Array, chex.ArrayTree]:
     del seed
-    features = self.predictive_all_features.predictives.observed_data.features
-    is_missing = (
-        features.continuous.is_missing[0] | features.categorical.is_missing[0]
-    )
-    gprm_threshold = self.predictive.predict(features)
-    threshold = _compute_ucb_threshold(
-        gprm_threshold, is_missing, self.ucb_coefficient
-    )
     gprm = self.predictive.predict(xs)
     mean = gprm.mean()
     stddev = gprm.stddev()
@@ -334,7 +361,7 @@ class PEScoreFunction(eqx.Module):
     gprm_all = self.predictive_all_features.predict(xs)
     stddev_from_all = gprm_all.stddev()
     acq_values = stddev_from_all + self.penalty_coefficient * jnp.minimum(
-        explore_ucb - threshold,
+        explore_ucb - self.threshold,
         0.0,
     )
     if self.trust_region is not None:
@@ -381,6 +408,9 @@ class SetPEScoreFunction(eqx.Module):
       values on `xs`.
     penalty_coefficient: Multiplier on the constraint violation penalty.
     trust_region:
+    threshold: The UCB threshold of the constraint. It is derived in
+      `__post_init__` from the predictive models and `ucb_coefficient`, and is
+      not a constructor argument.
 
   Returns:
     The Pure-Exploration acquisition value.
@@ -392,6 +422,14 @@ class SetPEScoreFunction(eqx.Module):
   explore_ucb_coefficient: jt.Float[jt.Array, '']
   penalty_coefficient: jt.Float[jt.Array, '']
   trust_region: Optional[acquisitions.TrustRegion]
+  threshold: jt.Float[jt.Array, ''] = eqx.field(init=False)
+
+  def __post_init__(self):
+    # The threshold does not depend on the evaluated points, so it is computed
+    # once here instead of in every call of `score_with_aux`.
+    self.threshold = eqx.filter_jit(_compute_pe_threshold)(
+        self.predictive, self.predictive_all_features, self.ucb_coefficient
+    )
 
   def score(
       self, xs: types.ModelInput, seed: Optional[jax.Array] = None
@@ -407,14 +445,6 @@ class SetPEScoreFunction(eqx.Module):
       self, xs: types.ModelInput, seed: Optional[jax.Array] = None
   ) -> tuple[jax.Array, chex.ArrayTree]:
     del seed
-    features = self.predictive_all_features.predictives.observed_data.features
-    is_missing = (
-        features.continuous.is_missing[0] | features.categorical.is_missing[0]
-    )
-    gprm_threshold = self.predictive.predict(features)
-    threshold = _compute_ucb_threshold(
-        gprm_threshold, is_missing, self.ucb_coefficient
-    )
     gprm = self.predictive.predict(xs)
     mean = gprm.mean()
     stddev = gprm.stddev()
@@ -424,7 +454,7 @@ class SetPEScoreFunction(eqx.Module):
     cov = gprm_all.covariance()
     acq_values = _logdet(cov) + self.penalty_coefficient * jnp.sum(
         jnp.minimum(
-            explore_ucb - threshold,
+            explore_ucb - self.threshold,
             0.0,
         ),
         axis=1,
@@ -502,6 +532,14 @@ class VizierGPUCBPEBandit(vza.Designer):
   _padding_schedule: padding.PaddingSchedule = attr.field(
       factory=padding.PaddingSchedule, kw_only=True
   )
+  # The acquisition optimizer only depends on the converter, so it is built
+  # (and jitted, if vectorized) once and reused across `suggest` calls.
+  _acquisition_optimizer: Union[
+      vza.GradientFreeOptimizer, vb.VectorizedOptimizer
+  ] = attr.field(init=False)
+  _jit_acquisition_optimizer: Optional[Callable[..., Any]] = attr.field(
+      init=False, default=None
+  )
 
   default_acquisition_optimizer_factory = vb.VectorizedOptimizerFactory(
       strategy_factory=es.VectorizedEagleStrategyFactory(
@@ -546,6 +584,13 @@ class VizierGPUCBPEBandit(vza.Designer):
         self._problem.search_space,
         seed=int(jax.random.randint(qrs_seed, [], 0, 2**16)),
     )
+    self._acquisition_optimizer = self._acquisition_optimizer_factory(
+        self._converter
+    )
+    if isinstance(self._acquisition_optimizer, vb.VectorizedOptimizer):
+      self._jit_acquisition_optimizer = eqx.filter_jit(
+          self._acquisition_optimizer
+      )
 
   def update(
       self, completed: vza.CompletedTrials, all_active: vza.ActiveTrials
@@ -790,7 +835,8 @@ class VizierGPUCBPEBandit(vza.Designer):
   ) -> vz.TrialSuggestion:
     """Generates one suggestion."""
     start_time = datetime.datetime.now()
-    self._rng, rng = jax.random.split(self._rng, 2)
+    # Draws all the keys needed for this suggestion with a single split.
+    self._rng, rng, acq_rng = jax.random.split(self._rng, 3)
     snr = model.params['signal_variance'] / jnp.maximum(
         model.params['observation_noise_variance'], 1e-12
     )
@@ -820,7 +866,7 @@ class VizierGPUCBPEBandit(vza.Designer):
 
     # TODO: Feed the eagle strategy with completed trials.
     # TODO: Change budget based on requested suggestion count.
-    acquisition_optimizer = self._acquisition_optimizer_factory(self._converter)
+    acquisition_optimizer = self._acquisition_optimizer
 
     pending_features = self._converter.to_features(active_trials)
     predictive_all_features = self._get_predictive_all_features(
@@ -847,9 +893,8 @@ class VizierGPUCBPEBandit(vza.Designer):
       )
 
     if isinstance(acquisition_optimizer, vb.VectorizedOptimizer):
-      acq_rng, self._rng = jax.random.split(self._rng)
       with profiler.timeit('acquisition_optimizer', also_log=True):
-        best_candidates = eqx.filter_jit(acquisition_optimizer)(
+        best_candidates = self._jit_acquisition_optimizer(
             scoring_fn.score,
             prior_features=vb.trials_to_sorted_array(
                 self._all_completed_trials, self._converter
@@ -945,11 +990,15 @@ class VizierGPUCBPEBandit(vza.Designer):
         trust_region=tr if self._use_trust_region else None,
     )
 
-    acquisition_optimizer = self._acquisition_optimizer_factory(self._converter)
+    if self._jit_acquisition_optimizer is None:
+      raise ValueError(
+          'Optimizing the set acquisition function requires a vectorized'
+          f' acquisition optimizer, got: {type(self._acquisition_optimizer)}'
+      )
 
     acq_rng, self._rng = jax.random.split(self._rng)
     with profiler.timeit('acquisition_optimizer', also_log=True):
-      best_candidates = eqx.filter_jit(acquisition_optimizer)(
+      best_candidates = self._jit_acquisition_optimizer(
           scoring_fn.score,
           prior_features=vb.trials_to_sorted_array(
               self._all_completed_trials, self._converter
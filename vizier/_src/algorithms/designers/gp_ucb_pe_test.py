@@ -16,8 +16,8 @@ from __future__ import annotations
 
 """Tests for gp_ucb_pe."""
 
-import copy
-from typing import Any, Tuple
+import collections
+from typing import Any, Sequence, Tuple
 
 import jax
 import numpy as np
@@ -33,7 +33,9 @@ from vizier.testing import test_studies
 from absl.testing import absltest
 from absl.testing import parameterized
 
-ensemble_ard_optimizer = optimizers.default_optimizer()
+# Both are frozen, so the empty instances can be shared across updates.
+_NO_COMPLETED_TRIALS = abstractions.CompletedTrials([])
+_NO_ACTIVE_TRIALS = abstractions.ActiveTrials([])
 
 
 def _extract_predictions(
@@ -49,7 +51,50 @@ def _extract_predictions(
   )
 
 
+def _extract_predictions_as_arrays(
+    trials: Sequence[vz.Trial], has_predictions: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+  """Extracts the predictions of trials into arrays indexed by trial.
+
+  Args:
+    trials: Trials suggested by the designer.
+    has_predictions: Boolean mask of the trials generated by acquisition
+      function optimization. The predictions of the other trials are NaN (and
+      False for `use_ucb`).
+
+  Returns:
+    Arrays of means, stddevs, stddevs_from_all, acquisitions and use_ucb.
+  """
+  num_trials = len(trials)
+  means = np.full(num_trials, np.nan)
+  stddevs = np.full(num_trials, np.nan)
+  stddevs_from_all = np.full(num_trials, np.nan)
+  acqs = np.full(num_trials, np.nan)
+  use_ucbs = np.zeros(num_trials, dtype=bool)
+  for idx in np.flatnonzero(has_predictions):
+    (
+        means[idx],
+        stddevs[idx],
+        stddevs_from_all[idx],
+        acqs[idx],
+        use_ucbs[idx],
+    ) = _extract_predictions(trials[idx].metadata.ns('gp_ucb_pe_bandit_test'))
+  return means, stddevs, stddevs_from_all, acqs, use_ucbs
+
+
 class GpUcbPeTest(parameterized.TestCase):
+  _ard_optimizer: optimizers.Optimizer
+  _acquisition_optimizer_factory: vb.VectorizedOptimizerFactory
+
+  @classmethod
+  def setUpClass(cls):
+    super().setUpClass()
+    # The optimizers are stateless, so they are shared across test cases.
+    cls._ard_optimizer = optimizers.default_optimizer()
+    cls._acquisition_optimizer_factory = vb.VectorizedOptimizerFactory(
+        strategy_factory=es.VectorizedEagleStrategyFactory(),
+        max_evaluations=100,
+    )
 
   @parameterized.parameters(
       dict(iters=3, batch_size=5, num_seed_trials=5),
@@ -99,20 +144,16 @@ class GpUcbPeTest(parameterized.TestCase):
     # We use string names so that test case names are readable. Convert them
     # to objects.
     if ard_optimizer == 'default':
-      ard_optimizer = optimizers.default_optimizer()
+      ard_optimizer = self._ard_optimizer
     problem = vz.ProblemStatement(search_space)
     problem.metric_information.append(
         vz.MetricInformation(
             name='metric', goal=vz.ObjectiveMetricGoal.MAXIMIZE
         )
     )
-    vectorized_optimizer_factory = vb.VectorizedOptimizerFactory(
-        strategy_factory=es.VectorizedEagleStrategyFactory(),
-        max_evaluations=100,
-    )
     designer = gp_ucb_pe.VizierGPUCBPEBandit(
         problem,
-        acquisition_optimizer_factory=vectorized_optimizer_factory,
+        acquisition_optimizer_factory=self._acquisition_optimizer_factory,
         num_seed_trials=num_seed_trials,
         ard_optimizer=ard_optimizer,
         metadata_ns='gp_ucb_pe_bandit_test',
@@ -140,9 +181,16 @@ class GpUcbPeTest(parameterized.TestCase):
         rng=jax.random.PRNGKey(1),
     )
 
-    all_active_trials = []
+    all_active_trials = collections.deque()
     all_trials = []
     trial_id = 1
+    # Pre-generates the metric values so that no JAX dispatch is needed per
+    # completed trial.
+    metric_samples = np.random.default_rng(1).uniform(
+        low=-10.0,
+        high=10.0,
+        size=(iters + 2, batch_size, len(problem.metric_information)),
+    )
     # Simulates batch suggestions with delayed feedback: the first two batches
     # are generated by the designer without any completed trials (but all with
     # active trials). Starting from the third batch, the oldest batch gets
@@ -156,44 +204,67 @@ class GpUcbPeTest(parameterized.TestCase):
       for suggestion in suggestions:
         problem.search_space.assert_contains(suggestion.parameters)
         all_active_trials.append(suggestion.to_trial(trial_id))
-        all_trials.append(copy.deepcopy(all_active_trials[-1]))
+        # Only the metadata of `all_trials` is read below, which completing the
+        # trial (in place) does not modify, so no copy is needed.
+        all_trials.append(all_active_trials[-1])
         trial_id += 1
       completed_trials = []
       # Starting from the second until the last but two batch, complete the
       # oldest batch of suggestions.
       if idx > 0 and idx < iters:
-        for _ in range(batch_size):
+        for jdx in range(batch_size):
           measurement = vz.Measurement()
-          for mi in problem.metric_information:
-            measurement.metrics[mi.name] = float(
-                jax.random.uniform(
-                    jax.random.PRNGKey(1),
-                    minval=mi.min_value_or(lambda: -10.0),
-                    maxval=mi.max_value_or(lambda: 10.0),
-                )
-            )
+          for mdx, mi in enumerate(problem.metric_information):
+            measurement.metrics[mi.name] = float(metric_samples[idx, jdx, mdx])
           completed_trials.append(
-              all_active_trials.pop(0).complete(measurement)
+              all_active_trials.popleft().complete(measurement)
           )
       designer.update(
-          completed=abstractions.CompletedTrials(completed_trials),
+          completed=abstractions.CompletedTrials(completed_trials)
+          if completed_trials
+          else _NO_COMPLETED_TRIALS,
           all_active=abstractions.ActiveTrials(all_active_trials),
       )
 
     self.assertLen(all_trials, (iters + 2) * batch_size)
 
+    # Before the designer was updated with enough trials, the suggested
+    # batches were seeds, not from acquisition optimization.
+    trial_batch = np.arange(len(all_trials)) // batch_size
+    from_acquisition = trial_batch * batch_size >= num_seed_trials
+    means, _, stddevs_from_all, acqs, use_ucbs = _extract_predictions_as_arrays(
+        all_trials, from_acquisition
+    )
+
     # The suggestions after the seeds up to the first two batches are expected
     # to be generated by the PE acquisition function.
-    for jdx in range(2 * batch_size):
-      # Before the designer was updated with enough trials, the suggested
-      # batches were seeds, not from acquisition optimization.
-      if (jdx // batch_size) * batch_size >= num_seed_trials:
-        _, _, _, acq, use_ucb = _extract_predictions(
-            all_trials[jdx].metadata.ns('gp_ucb_pe_bandit_test')
-        )
-        self.assertFalse(use_ucb)
-        if not optimize_set_acquisition_for_exploration:
-          self.assertGreaterEqual(acq, 0.0, msg=f'suggestion: {jdx}')
+    first_two_batches = from_acquisition & (trial_batch < 2)
+    self.assertFalse(np.any(use_ucbs[first_two_batches]))
+    if not optimize_set_acquisition_for_exploration:
+      self.assertTrue(
+          np.all(acqs[first_two_batches] >= 0.0),
+          msg=f'acquisitions: {acqs[first_two_batches]}',
+      )
+
+    # Groups the predictions by batch of suggestions: [iters + 2, batch_size].
+    batch_means, batch_stddevs_from_all, batch_acqs, batch_use_ucbs = (
+        x.reshape(iters + 2, batch_size)
+        for x in (means, stddevs_from_all, acqs, use_ucbs)
+    )
+    if not pe_overwrite and not turns_on_high_noise_mode:
+      # Except for the last batch of suggestions, the acquisition value of the
+      # first suggestion in a batch is expected to be UCB, which combines the
+      # predicted mean based only on completed trials and the predicted
+      # standard deviation based on all trials.
+      ucb_batches = np.arange(2, iters + 1)
+      ucb_batches = ucb_batches[ucb_batches * batch_size >= num_seed_trials]
+      np.testing.assert_allclose(
+          batch_means[ucb_batches, 0]
+          + 10.0 * batch_stddevs_from_all[ucb_batches, 0],
+          batch_acqs[ucb_batches, 0],
+          rtol=0.0,
+          atol=5e-8,
+      )
 
     for idx in range(2, iters + 2):
       # Skips seed trials, which are not generated by acquisition function
@@ -201,30 +272,25 @@ class GpUcbPeTest(parameterized.TestCase):
       if idx * batch_size < num_seed_trials:
         continue
       set_acq_value = None
-      stddev_from_all_list = []
-      for jdx in range(batch_size):
-        mean, _, stddev_from_all, acq, use_ucb = _extract_predictions(
-            all_trials[idx * batch_size + jdx].metadata.ns(
-                'gp_ucb_pe_bandit_test'
-            )
-        )
+      for jdx, (stddev_from_all, acq, use_ucb) in enumerate(
+          zip(
+              batch_stddevs_from_all[idx],
+              batch_acqs[idx],
+              batch_use_ucbs[idx],
+          )
+      ):
         if (
             jdx == 0
             and idx < (iters + 1)
             and not pe_overwrite
             and not turns_on_high_noise_mode
         ):
-          # Except for the last batch of suggestions, the acquisition value of
-          # the first suggestion in a batch is expected to be UCB, which
-          # combines the predicted mean based only on completed trials and the
-          # predicted standard deviation based on all trials.
-          self.assertAlmostEqual(mean + 10.0 * stddev_from_all, acq)
+          # The UCB acquisition values are checked above.
           self.assertTrue(use_ucb)
           continue
 
         self.assertFalse(use_ucb)
         if optimize_set_acquisition_for_exploration:
-          stddev_from_all_list.append(stddev_from_all)
           if set_acq_value is None:
             set_acq_value = acq
           else:
@@ -240,11 +306,14 @@ class GpUcbPeTest(parameterized.TestCase):
               acq, stddev_from_all, msg=f'batch: {idx}, suggestion: {jdx}'
           )
       if optimize_set_acquisition_for_exploration:
+        set_stddevs_from_all = batch_stddevs_from_all[idx][
+            ~batch_use_ucbs[idx]
+        ]
         geometric_mean_of_pred_cov_eigs = np.exp(
             set_acq_value / (batch_size - 1)
         )
         arithmetic_mean_of_pred_cov_eigs = np.mean(
-            np.square(stddev_from_all_list)
+            set_stddevs_from_all * set_stddevs_from_all
         )
         self.assertLessEqual(
             geometric_mean_of_pred_cov_eigs, arithmetic_mean_of_pred_cov_eigs
@@ -259,13 +328,9 @@ class GpUcbPeTest(parameterized.TestCase):
             name='metric', goal=vz.ObjectiveMetricGoal.MAXIMIZE
         )
     )
-    vectorized_optimizer_factory = vb.VectorizedOptimizerFactory(
-        strategy_factory=es.VectorizedEagleStrategyFactory(),
-        max_evaluations=100,
-    )
     designer = gp_ucb_pe.VizierGPUCBPEBandit(
         problem,
-        acquisition_optimizer_factory=vectorized_optimizer_factory,
+        acquisition_optimizer_factory=self._acquisition_optimizer_factory,
         metadata_ns='gp_ucb_pe_bandit_test',
         num_seed_trials=1,
         config=gp_ucb_pe.UCBPEConfig(
@@ -283,57 +348,54 @@ class GpUcbPeTest(parameterized.TestCase):
     trial_id = 1
     batch_size = 5
     iters = 3
-    rng = jax.random.PRNGKey(1)
+    metric_samples = np.random.default_rng(1).uniform(
+        low=-10.0,
+        high=10.0,
+        size=(iters, batch_size, len(problem.metric_information)),
+    )
     all_trials = []
     # Simulates a batch suggestion loop that completes a full batch of
     # suggestions before asking for the next batch.
-    for _ in range(iters):
+    for idx in range(iters):
       suggestions = designer.suggest(count=batch_size)
       self.assertLen(suggestions, batch_size)
       completed_trials = []
-      for suggestion in suggestions:
+      for jdx, suggestion in enumerate(suggestions):
         problem.search_space.assert_contains(suggestion.parameters)
         trial_id += 1
         measurement = vz.Measurement()
-        for mi in problem.metric_information:
-          measurement.metrics[mi.name] = float(
-              jax.random.uniform(
-                  rng,
-                  minval=mi.min_value_or(lambda: -10.0),
-                  maxval=mi.max_value_or(lambda: 10.0),
-              )
-          )
-          rng, _ = jax.random.split(rng)
+        for mdx, mi in enumerate(problem.metric_information):
+          measurement.metrics[mi.name] = float(metric_samples[idx, jdx, mdx])
         completed_trials.append(
             suggestion.to_trial(trial_id).complete(measurement)
         )
       all_trials.extend(completed_trials)
       designer.update(
           completed=abstractions.CompletedTrials(completed_trials),
-          all_active=abstractions.ActiveTrials(),
+          all_active=_NO_ACTIVE_TRIALS,
       )
 
     self.assertLen(all_trials, iters * batch_size)
 
-    for idx, trial in enumerate(all_trials):
-      if idx < batch_size:
-        # Skips the first batch of suggestions, which are generated by the
-        # seeding designer, not acquisition function optimization.
-        continue
-      # Because `ucb_overwrite_probability` is 1, all suggestions after the
-      # first batch are expected to be generated by UCB. Within a batch, the
-      # first suggestion's UCB value is expected to use predicted standard
-      # deviation based only on completed trials, while the UCB values of
-      # the second to the last suggestions are expected to use the predicted
-      # standard deviations based on completed and active trials.
-      mean, stddev, stddev_from_all, acq, use_ucb = _extract_predictions(
-          trial.metadata.ns('gp_ucb_pe_bandit_test')
-      )
-      self.assertAlmostEqual(
-          mean + 10.0 * (stddev_from_all if idx % batch_size > 0 else stddev),
-          acq,
-      )
-      self.assertTrue(use_ucb)
+    # Skips the first batch of suggestions, which are generated by the seeding
+    # designer, not acquisition function optimization.
+    from_acquisition = np.arange(len(all_trials)) >= batch_size
+    means, stddevs, stddevs_from_all, acqs, use_ucbs = (
+        x[from_acquisition]
+        for x in _extract_predictions_as_arrays(all_trials, from_acquisition)
+    )
+    # Because `ucb_overwrite_probability` is 1, all suggestions after the first
+    # batch are expected to be generated by UCB. Within a batch, the first
+    # suggestion's UCB value is expected to use predicted standard deviation
+    # based only on completed trials, while the UCB values of the second to the
+    # last suggestions are expected to use the predicted standard deviations
+    # based on completed and active trials.
+    index_in_batch = np.arange(len(means)) % batch_size
+    ucb_stddevs = np.where(index_in_batch > 0, stddevs_from_all, stddevs)
+    np.testing.assert_allclose(
+        means + 10.0 * ucb_stddevs, acqs, rtol=0.0, atol=5e-8
+    )
+    self.assertTrue(np.all(use_ucbs))
 
 
 if __name__ == '__main__':
@@ -18,6 +18,7 @@ from __future__ import annotations
 
 # TODO: Raise vizier-specific exceptions.
 
+import copy
 from typing import Any, Callable, Iterable, Iterator, List, Mapping, Optional, Type
 import attr
 
@@ -34,16 +35,22 @@ ResourceNotFoundError = client_abc.ResourceNotFoundError
 environment_variables = vizier_client.environment_variables
 
 
-@attr.define
+@attr.define(slots=True)
 class Trial(client_abc.TrialInterface):
   """Trial class.
 
   This class owns a Vizier client of the Study that contains the Trial that
-  it is associated with.
+  it is associated with. Trials obtained by iterating over `Study.trials()`
+  hold the snapshot fetched with them, so `materialize` returns a copy of it
+  without an RPC. The snapshot is dropped when the Trial is modified through
+  this object, or explicitly by `refresh`.
   """
 
   _client: vizier_client.VizierClient = attr.field()
   _id: int = attr.field(validator=attr.validators.instance_of(int))
+  _trial: Optional[vz.Trial] = attr.field(
+      default=None, kw_only=True, repr=False, eq=False
+  )
 
   @property
   def id(self) -> int:
@@ -52,13 +59,15 @@ class Trial(client_abc.TrialInterface):
   @property
   def parameters(self) -> Mapping[str, Any]:
     trial = self.materialize(include_all_measurements=False)
-    study_config = self._client.get_study_config()
+    study_config = self._client.get_cached_study_config()
     return study_config.trial_parameters(vz.TrialConverter.to_proto(trial))
 
   def delete(self) -> None:
+    self._trial = None
     self._client.delete_trial(self._id)
 
   def update_metadata(self, delta: vz.Metadata) -> None:
+    self._trial = None
     actual_delta = vz.MetadataDelta(on_trials={self._id: delta})
     self._client.update_metadata(actual_delta)
 
@@ -68,31 +77,38 @@ class Trial(client_abc.TrialInterface):
       *,
       infeasible_reason: Optional[str] = None,
   ) -> Optional[vz.Measurement]:
-    self._trial = self._client.complete_trial(
+    self._trial = None
+    trial = self._client.complete_trial(
         self._id, measurement, infeasible_reason
     )
-    return self._trial.final_measurement
+    return trial.final_measurement
 
   def check_early_stopping(self) -> bool:
+    # The service may move the trial into STOPPING state.
+    self._trial = None
     return self._client.should_trial_stop(self._id)
 
   def stop(self) -> None:
+    self._trial = None
     return self._client.stop_trial(self._id)
 
   def add_measurement(self, measurement: vz.Measurement) -> None:
-    self._client.report_intermediate_objective_value(
-        int(measurement.steps),
-        measurement.elapsed_secs,
-        [{k: v.value for k, v in measurement.metrics.items()}],
-        trial_id=self._id,
-    )
+    self._trial = None
+    self._client.add_trial_measurement(self._id, measurement)
+
+  def refresh(self) -> None:
+    """Drops the cached snapshot so `materialize` fetches the latest Trial."""
+    self._trial = None
 
   def materialize(
       self,
       *,
       include_all_measurements: bool = True,
   ) -> vz.Trial:
-    trial = self._client.get_trial(self._id)
+    if self._trial is None:
+      trial = self._client.get_trial(self._id)
+    else:
+      trial = copy.deepcopy(self._trial)
     if not include_all_measurements:
       trial.measurements.clear()
     return trial
@@ -102,7 +118,7 @@ class Trial(client_abc.TrialInterface):
     return Study(self._client)
 
 
-@attr.define
+@attr.define(slots=True)
 class TrialIterable(client_abc.TrialIterable):
   """Holds a collection of materialized Trials.
 
@@ -114,14 +130,14 @@ class TrialIterable(client_abc.TrialIterable):
 
   def __iter__(self) -> Iterator[Trial]:
     for trial in self._iterable_factory():
-      yield Trial(self._client, trial.id)
+      yield Trial(self._client, trial.id, trial=trial)
 
   def get(self) -> Iterator[vz.Trial]:
     for trial in self._iterable_factory():
       yield trial
 
 
-@attr.define
+@attr.define(slots=True)
 class Study(client_abc.StudyInterface):
   """Responsible for study-level operations."""
 
@@ -210,7 +226,9 @@ class Study(client_abc.StudyInterface):
         constants.UNUSED_CLIENT_ID,
     )
     try:
-      _ = client.get_study_config()  # Make sure study exists.
+      # Make sure study exists. This also caches the config for the
+      # `parameters` of this study's Trials.
+      _ = client.get_cached_study_config()
     except Exception as err:
       raise KeyError(f'Study {name} does not exist.') from err
     return Study(client)
@@ -16,15 +16,18 @@ from __future__ import annotations
 
 """Tests for clients."""
 import functools
+from unittest import mock
 
 from absl import logging
 from vizier._src.service import clients
 from vizier._src.service import constants
+from vizier._src.service import vizier_client
 from vizier._src.service import vizier_server
 from vizier.client import client_abc_testing
 from vizier.service import pyvizier as vz
 
 from absl.testing import absltest
+from absl.testing import parameterized
 
 
 # Affects local Vizier servicer tests only.
@@ -61,6 +64,42 @@ class VizierClientTest(client_abc_testing.TestCase):
     study_factory = functools.partial(create_study, study_id=self.id())
     self.assertPassesE2ETuning(study_factory=study_factory, num_iterations=2)
 
+  def test_iterated_trial_materializes_without_rpc(self):
+    study = self.create_test_study(self.id())
+    study.suggest(count=1)
+    (trial,) = study.trials()
+    with mock.patch.object(
+        vizier_client.VizierClient, 'get_trial', autospec=True
+    ) as get_trial:
+      trial.materialize()
+    get_trial.assert_not_called()
+
+  @parameterized.named_parameters(
+      ('Refresh', lambda t: t.refresh()),
+      ('Delete', lambda t: t.delete()),
+      ('UpdateMetadata', lambda t: t.update_metadata(vz.Metadata(foo='bar'))),
+      ('Stop', lambda t: t.stop()),
+      ('CheckEarlyStopping', lambda t: t.check_early_stopping()),
+      (
+          'AddMeasurement',
+          lambda t: t.add_measurement(vz.Measurement({'maximize_metric': 0.5})),
+      ),
+      (
+          'Complete',
+          lambda t: t.complete(vz.Measurement({'maximize_metric': 1.0})),
+      ),
+  )
+  def test_modified_trial_is_refetched(self, modify_fn):
+    study = self.create_test_study(self.id())
+    study.suggest(count=1)
+    (trial,) = study.trials()
+    modify_fn(trial)
+    with mock.patch.object(
+        vizier_client.VizierClient, 'get_trial', autospec=True
+    ) as get_trial:
+      trial.materialize()
+    get_trial.assert_called_once()
+
 
 class VizierClientTestOnServicer(VizierClientTest):
 
@@ -90,8 +90,23 @@ class DataStore(abc.ABC):
     """Updates pre-existing trial. If nonexistent, raises NotFoundError."""
 
   @abc.abstractmethod
-  def list_trials(self, study_name: str) -> List[study_pb2.Trial]:
-    """List all trials for study. If study nonexistent, raises NotFoundError."""
+  def list_trials(
+      self,
+      study_name: str,
+      *,
+      after_trial_id: int = 0,
+      max_num_trials: Optional[int] = None,
+  ) -> List[study_pb2.Trial]:
+    """List trials for study. If study nonexistent, raises NotFoundError.
+
+    Trials are ordered by trial id, so a listing can be resumed from the last
+    trial id seen.
+
+    Args:
+      study_name: Resource name of the study.
+      after_trial_id: Only trials with a larger id are listed.
+      max_num_trials: If set, at most this many trials are listed.
+    """
 
   @abc.abstractmethod
   def delete_trial(self, trial_name: str) -> None:
@@ -122,6 +122,11 @@ class DataStoreTestCase(parameterized.TestCase):
     self.assertEqual(list_of_trials, trials)
     self.assertIsNot(list_of_trials, trials)  # Check pass-by-value.
 
+    page_of_trials = ds.list_trials(
+        study.name, after_trial_id=int(trials[0].id), max_num_trials=1
+    )
+    self.assertEqual(page_of_trials, trials[1:2])
+
     first_trial = trials[0]
     first_trial.infeasible_reason = make_random_string()
     ds.update_trial(first_trial)
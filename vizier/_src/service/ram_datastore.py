@@ -18,6 +18,7 @@ from __future__ import annotations
 
 For debugging/testing purposes mainly.
 """
+import bisect
 import collections
 import copy
 import dataclasses
@@ -61,6 +62,9 @@ class StudyNode:
       default_factory=dict
   )
 
+  # Keys of `trial_protos` in ascending order, for paged listing.
+  sorted_trial_ids: List[int] = dataclasses.field(default_factory=list)
+
   # Keys are `operation_id`.
   early_stopping_operations: Dict[
       str, vizier_oss_pb2.EarlyStoppingOperation
@@ -160,17 +164,14 @@ class NestedDictRAMDataStore(datastore.DataStore):
   def create_trial(self, trial: study_pb2.Trial) -> resources.TrialResource:
     resource = resources.TrialResource.from_name(trial.name)
     with self._lock:
-      trial_protos = (
-          self._owners[resource.owner_id]
-          .studies[resource.study_id]
-          .trial_protos
-      )
-      if resource.trial_id in trial_protos:
+      study_node = self._owners[resource.owner_id].studies[resource.study_id]
+      if resource.trial_id in study_node.trial_protos:
         raise custom_errors.AlreadyExistsError(
             'Trial %s already exists' % trial.name
         )
       else:
-        trial_protos[resource.trial_id] = copy.deepcopy(trial)
+        study_node.trial_protos[resource.trial_id] = copy.deepcopy(trial)
+        bisect.insort(study_node.sorted_trial_ids, resource.trial_id)
     return resource
 
   def get_trial(self, trial_name: str) -> study_pb2.Trial:
@@ -207,17 +208,25 @@ class NestedDictRAMDataStore(datastore.DataStore):
           'Could not update Trial with name:', resource.name
       ) from err
 
-  def list_trials(self, study_name: str) -> List[study_pb2.Trial]:
+  def list_trials(
+      self,
+      study_name: str,
+      *,
+      after_trial_id: int = 0,
+      max_num_trials: Optional[int] = None,
+  ) -> List[study_pb2.Trial]:
     resource = resources.StudyResource.from_name(study_name)
     try:
       with self._lock:
-        return copy.deepcopy(
-            list(
-                self._owners[resource.owner_id]
-                .studies[resource.study_id]
-                .trial_protos.values()
-            )
-        )
+        study_node = self._owners[resource.owner_id].studies[resource.study_id]
+        trial_ids = study_node.sorted_trial_ids
+        start = bisect.bisect_right(trial_ids, after_trial_id)
+        end = None if max_num_trials is None else start + max_num_trials
+        # Only the requested page is copied.
+        return [
+            copy.deepcopy(study_node.trial_protos[i])
+            for i in trial_ids[start:end]
+        ]
     except KeyError as err:
       raise custom_errors.NotFoundError(
           'Study does not exist:', study_name
@@ -227,11 +236,10 @@ class NestedDictRAMDataStore(datastore.DataStore):
     resource = resources.TrialResource.from_name(trial_name)
     try:
       with self._lock:
-        del (
-            self._owners[resource.owner_id]
-            .studies[resource.study_id]
-            .trial_protos[resource.trial_id]
-        )
+        study_node = self._owners[resource.owner_id].studies[resource.study_id]
+        del study_node.trial_protos[resource.trial_id]
+        trial_ids = study_node.sorted_trial_ids
+        del trial_ids[bisect.bisect_left(trial_ids, resource.trial_id)]
     except KeyError as err:
       raise custom_errors.NotFoundError(
           'Trial does not exist:', trial_name
@@ -249,7 +249,13 @@ class SQLDataStore(datastore.DataStore):
 
     return trial_resource
 
-  def list_trials(self, study_name: str) -> List[study_pb2.Trial]:
+  def list_trials(
+      self,
+      study_name: str,
+      *,
+      after_trial_id: int = 0,
+      max_num_trials: Optional[int] = None,
+  ) -> List[study_pb2.Trial]:
     study_resource = resources.StudyResource.from_name(study_name)
 
     # Exist query
@@ -261,6 +267,10 @@ class SQLDataStore(datastore.DataStore):
     lq = sqla.select(self._trials_table)
     lq = lq.where(self._trials_table.c.owner_id == study_resource.owner_id)
     lq = lq.where(self._trials_table.c.study_id == study_resource.study_id)
+    lq = lq.where(self._trials_table.c.trial_id > after_trial_id)
+    lq = lq.order_by(self._trials_table.c.trial_id)
+    if max_num_trials is not None:
+      lq = lq.limit(max_num_trials)
 
     with self._lock:
       if not self._connection.execute(eq).fetchone()[0]:
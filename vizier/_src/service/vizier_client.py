@@ -22,7 +22,7 @@ This client can be used interchangeably with the Cloud Vizier client.
 import datetime
 import functools
 import time
-from typing import Any, Dict, List, Mapping, Optional, Union
+from typing import Any, Dict, Iterator, List, Mapping, Optional, Union
 
 from absl import logging
 import attr
@@ -107,6 +107,11 @@ class VizierClient:
   _service: types.VizierService = attr.field(
       repr=False, factory=create_vizier_servicer_or_stub
   )
+  # The class is frozen, so `get_cached_study_config` stores the fetched config
+  # in this mutable list, which holds at most one element.
+  _cached_study_config: List[pyvizier.StudyConfig] = attr.field(
+      init=False, factory=list, repr=False, eq=False
+  )
 
   @property
   def _study_resource(self) -> resources.StudyResource:
@@ -215,6 +220,19 @@ class VizierClient:
         step_count=step,
         metrics=new_metric_list,
     )
+    return self._add_trial_measurement_proto(trial_id, measurement)
+
+  def add_trial_measurement(
+      self, trial_id: int, measurement: pyvizier.Measurement
+  ) -> pyvizier.Trial:
+    """Adds an intermediate measurement to the trial identified by trial_id."""
+    return self._add_trial_measurement_proto(
+        trial_id, pyvizier.MeasurementConverter.to_proto(measurement)
+    )
+
+  def _add_trial_measurement_proto(
+      self, trial_id: int, measurement: study_pb2.Measurement
+  ) -> pyvizier.Trial:
     request = vizier_service_pb2.AddTrialMeasurementRequest(
         trial_name=resources.TrialResource(
             self._owner_id, self._study_id, trial_id
@@ -286,6 +304,27 @@ class VizierClient:
     response = self._service.ListTrials(request)
     return pyvizier.TrialConverter.from_protos(response.trials)
 
+  def iter_trials(self, page_size: int = 100) -> Iterator[pyvizier.Trial]:
+    """Iterates over all trials, fetching them one page at a time.
+
+    Args:
+      page_size: The maximum number of trials fetched per RPC.
+
+    Yields:
+      Trials, ordered by id.
+    """
+    parent = resources.StudyResource(self._owner_id, self._study_id).name
+    page_token = ''
+    while True:
+      request = vizier_service_pb2.ListTrialsRequest(
+          parent=parent, page_size=page_size, page_token=page_token
+      )
+      response = self._service.ListTrials(request)
+      yield from pyvizier.TrialConverter.from_protos(response.trials)
+      page_token = response.next_page_token
+      if not page_token:
+        return
+
   def list_optimal_trials(self) -> List[pyvizier.Trial]:
     """List only the optimal completed trials."""
     parent = resources.StudyResource(self._owner_id, self._study_id).name
@@ -352,6 +391,17 @@ class VizierClient:
     study = self._service.GetStudy(request)
     return pyvizier.StudyConfig.from_proto(study.study_spec)
 
+  def get_cached_study_config(self) -> pyvizier.StudyConfig:
+    """Returns the study config, only fetching it on the first call.
+
+    The search space of a study cannot change after it is created, so the cached
+    config may be used to look up parameters. Use `get_study_config` for the
+    latest study metadata.
+    """
+    if not self._cached_study_config:
+      self._cached_study_config.append(self.get_study_config())
+    return self._cached_study_config[0]
+
   def get_study_state(
       self, study_resource_name: Optional[str] = None
   ) -> pyvizier.StudyState:
@@ -123,6 +123,11 @@ class VizierClientTest(parameterized.TestCase):
     self.client.set_study_state(state)
     self.assertEqual(self.client.get_study_state(), state)
 
+  def test_get_cached_study_config(self):
+    study_config = self.client.get_cached_study_config()
+    self.assertEqual(study_config, self.client.get_study_config())
+    self.assertIs(self.client.get_cached_study_config(), study_config)
+
   def test_delete_study(self):
     self.client.delete_study()
     empty_list_json = self.client.list_studies()
@@ -132,6 +137,17 @@ class VizierClientTest(parameterized.TestCase):
     trial_list = self.client.list_trials()
     self.assertLen(trial_list, 1)
 
+  def test_iter_trials(self):
+    for i in range(2, 6):
+      active_trial = study_pb2.Trial(
+          name=resources.TrialResource(self.owner_id, self.study_id, i).name,
+          id=str(i),
+          state=study_pb2.Trial.State.ACTIVE,
+      )
+      self.servicer.datastore.create_trial(active_trial)
+    trials = list(self.client.iter_trials(page_size=2))
+    self.assertEqual([t.id for t in trials], [1, 2, 3, 4, 5])
+
   def test_list_optimal_trials(self):
     for i in range(2, 10):
       metric = study_pb2.Measurement.Metric(
@@ -204,6 +220,21 @@ class VizierClientTest(parameterized.TestCase):
     )
     self.assertEqual(updated_trial.id, 1)
 
+  def test_add_trial_measurement(self):
+    updated_trial = self.client.add_trial_measurement(
+        trial_id=1,
+        measurement=vz.Measurement(
+            metrics={'example_metric': 5.0}, elapsed_secs=3.0, steps=5
+        ),
+    )
+    self.assertLen(updated_trial.measurements, 1)
+    self.assertEqual(updated_trial.measurements[0].steps, 5)
+    self.assertEqual(updated_trial.measurements[0].elapsed_secs, 3.0)
+    self.assertEqual(
+        updated_trial.measurements[0].metrics['example_metric'],
+        vz.Metric(value=5.0),
+    )
+
   def test_get_suggestions(self):
     suggestion_count = 2
     suggestions_list = self.client.get_suggestions(
@@ -513,9 +513,44 @@ class VizierServicer(vizier_service_pb2_grpc.VizierServiceServicer):
       request: vizier_service_pb2.ListTrialsRequest,
       context: Optional[grpc.ServicerContext] = None,
   ) -> vizier_service_pb2.ListTrialsResponse:
-    """Lists the Trials associated with a Study."""
-    list_of_trials = self.datastore.list_trials(request.parent)
-    return vizier_service_pb2.ListTrialsResponse(trials=list_of_trials)
+    """Lists the Trials associated with a Study.
+
+    If `request.page_size` is positive, at most that many Trials are returned,
+    ordered by id. `request.page_token` holds the id of the last Trial of the
+    previous page, so Trials added or deleted between pages do not shift the
+    remaining ones.
+
+    Args:
+      request:
+      context:
+
+    Returns:
+      A page of Trials and the token of the next page, if any.
+    """
+    if request.page_size <= 0:
+      return vizier_service_pb2.ListTrialsResponse(
+          trials=self.datastore.list_trials(request.parent)
+      )
+
+    page_token = request.page_token or '0'
+    if not page_token.isdigit():
+      grpc_util.handle_exception(
+          ValueError(f'Invalid page_token: {request.page_token}'), context
+      )
+      return vizier_service_pb2.ListTrialsResponse()
+    # One extra Trial is fetched to tell whether another page follows.
+    trials = self.datastore.list_trials(
+        request.parent,
+        after_trial_id=int(page_token),
+        max_num_trials=request.page_size + 1,
+    )
+    if len(trials) <= request.page_size:
+      return vizier_service_pb2.ListTrialsResponse(trials=trials)
+    trials = trials[: request.page_size]
+    last_trial_id = TrialResource.from_name(trials[-1].name).trial_id
+    return vizier_service_pb2.ListTrialsResponse(
+        trials=trials, next_page_token=str(last_trial_id)
+    )
 
   def AddTrialMeasurement(
       self,
@@ -442,6 +442,54 @@ class VizierServicerTest(parameterized.TestCase):
           )
       )
 
+  def test_list_trials_paging(self):
+    study = test_util.generate_study(self.owner_id, self.study_id)
+    self.vs.datastore.create_study(study)
+    for trial in test_util.generate_trials(
+        [1, 2, 3, 4, 5], self.owner_id, self.study_id
+    ):
+      self.vs.datastore.create_trial(trial)
+    study_name = resources.StudyResource(self.owner_id, self.study_id).name
+
+    first_page = self.vs.ListTrials(
+        vizier_service_pb2.ListTrialsRequest(parent=study_name, page_size=2)
+    )
+    self.assertEqual([t.id for t in first_page.trials], ['1', '2'])
+    self.assertEqual(first_page.next_page_token, '2')
+
+    # Deleting a listed trial does not shift the remaining pages.
+    self.vs.datastore.delete_trial(first_page.trials[0].name)
+    second_page = self.vs.ListTrials(
+        vizier_service_pb2.ListTrialsRequest(
+            parent=study_name,
+            page_size=2,
+            page_token=first_page.next_page_token,
+        )
+    )
+    self.assertEqual([t.id for t in second_page.trials], ['3', '4'])
+
+    last_page = self.vs.ListTrials(
+        vizier_service_pb2.ListTrialsRequest(
+            parent=study_name,
+            page_size=2,
+            page_token=second_page.next_page_token,
+        )
+    )
+    self.assertEqual([t.id for t in last_page.trials], ['5'])
+    self.assertEmpty(last_page.next_page_token)
+
+  def test_list_trials_invalid_page_token(self):
+    study = test_util.generate_study(self.owner_id, self.study_id)
+    self.vs.datastore.create_study(study)
+    study_name = resources.StudyResource(self.owner_id, self.study_id).name
+
+    with self.assertRaises(grpc.RpcError):
+      self.vs.ListTrials(
+          vizier_service_pb2.ListTrialsRequest(
+              parent=study_name, page_size=2, page_token='not_a_trial_id'
+          )
+      )
+
   @parameterized.parameters(
       (study_pb2.Study.State.COMPLETED,),
       (study_pb2.Study.State.INACTIVE,),
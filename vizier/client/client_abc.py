@@ -47,6 +47,9 @@ class ResourceNotFoundError(LookupError):
 class TrialInterface(abc.ABC):
   """Responsible for trial-level operations."""
 
+  # Lets slotted subclasses avoid a per-instance __dict__.
+  __slots__ = ()
+
   @property
   @abc.abstractmethod
   def id(self) -> int:
@@ -179,6 +182,8 @@ class TrialIterable(abc.ABC):
   uses a generator of the materialized trials.
   """
 
+  __slots__ = ()
+
   @abc.abstractmethod
   def __iter__(self) -> Iterator[TrialInterface]:
     """Returns an iterator of TrialInterfaces, which are clients."""
@@ -191,6 +196,8 @@ class TrialIterable(abc.ABC):
 class StudyInterface(abc.ABC):
   """Responsible for study-level operations."""
 
+  __slots__ = ()
+
   @property
   @abc.abstractmethod
   def resource_name(self) -> str: